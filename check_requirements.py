@@ -61,15 +61,13 @@ def check_existing_dependencies():
     """Check if required packages are already installed"""
     print("✓ Checking existing dependencies...")
     packages = {
-        "requests": False,
-        "beautifulsoup4": False,
-        "packaging": False,
+        "urllib3": False,
         "click": False
     }
     
     for package in packages:
         try:
-            __import__(package if package != "beautifulsoup4" else "bs4")
+            __import__(package)
             print(f"  ✓ {package} already installed")
             packages[package] = True
         except ImportError:
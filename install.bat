@@ -28,7 +28,7 @@ echo Installing required packages...
 echo.
 
 REM Install the package
-%PIP_CMD% install requests beautifulsoup4 packaging click
+%PIP_CMD% install urllib3 click
 
 if %errorlevel% neq 0 (
     echo.
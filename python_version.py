@@ -7,48 +7,191 @@ IMPORTANT: This tool installs Python but does NOT modify your system's default P
 Your existing Python installation remains unchanged to avoid breaking system tools.
 
 Requirements:
-    pip install requests beautifulsoup4 packaging click
+    pip install urllib3 click
 
 Note: Dependencies are automatically installed via setup.py during CLI installation.
 """
 
 import platform
 import sys
+import codecs
 import os
 import subprocess
 import tempfile
 import shutil
 import hashlib
+import functools
+import importlib
+import json
 import re
 import time
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-try:
-    import requests
-    from bs4 import BeautifulSoup
-    from packaging import version as pkg_version
-    import click
-except ImportError as e:
+
+def _missing_dependencies(error: ImportError):
+    """Explain how to install the required packages, then exit"""
     print("ERROR: Missing required packages.")
     print("Please install them using:")
-    print("  pip install requests beautifulsoup4 packaging click")
+    print("  pip install urllib3 click")
     print("\nOr install this tool via:")
     print("  pip install -e .")
-    print(f"\nDetails: {e}")
+    print(f"\nDetails: {error}")
     sys.exit(1)
 
+
+# Only click is needed for every invocation; urllib3 is imported lazily by
+# the functions that use it so `pyvm --version` and `pyvm info` start fast.
+try:
+    import click
+except ImportError as e:
+    _missing_dependencies(e)
+
+
+def _require(*modules: str):
+    """Decorator: make sure the given modules are importable before running"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for name in modules:
+                try:
+                    importlib.import_module(name)
+                except ImportError as e:
+                    _missing_dependencies(e)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
 # Constants
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
 DOWNLOAD_TIMEOUT = 120  # seconds
 REQUEST_TIMEOUT = 15  # seconds
+CONNECT_TIMEOUT = 5  # seconds
+USER_AGENT = "pyvm-updater (+https://github.com/shreyasmene06/pyvm-updater)"
+DOWNLOADS_URL = "https://www.python.org/downloads/"
+RELEASE_API_URL = "https://www.python.org/api/v2/downloads/release/"
+RELEASE_FILE_API_URL = "https://www.python.org/api/v2/downloads/release_file/"
+CACHE_TTL = 6 * 60 * 60  # seconds - new Python releases are rare
+PAGE_CHUNK_SIZE = 16 * 1024  # bytes fed to the HTML parser at a time
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read/write in download_file
+
+# Version strings look like 3.11 or 3.11.5
+_VER_RE = re.compile(r'\A\d+\.\d+(?:\.\d+)*\Z')
+_VER_SPLIT_CACHE: Dict[str, Tuple[str, ...]] = {}
+# CPython release names in the downloads API, e.g. "Python 3.14.0". Other
+# products listed there ("Python install manager 25.0") must not match.
+_RELEASE_NAME_RE = re.compile(r'\APython (\d+\.\d+(?:\.\d+)*)\Z')
+
+_POOL = None
+
+
+def _get_pool():
+    """Return the shared urllib3 connection pool, creating it on first use.
+
+    The version check and the installer download hit the same host back to
+    back, so keep-alive saves a full TCP+TLS handshake. Retries are handled
+    by get_latest_python_info_with_retry; the pool only follows redirects.
+    """
+    global _POOL
+    if _POOL is None:
+        import urllib3
+        _POOL = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=4,
+            retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5),
+            headers=urllib3.make_headers(user_agent=USER_AGENT, accept_encoding=['gzip', 'deflate']),
+        )
+    return _POOL
+
+
+def _raise_for_status(response, url: str):
+    """Raise urllib3's HTTPError for 4xx/5xx responses"""
+    from urllib3.exceptions import HTTPError
+    if response.status >= 400:
+        raise HTTPError(f"{response.status} {response.reason} for url: {url}")
+
+
+def _is_timeout(error: Exception) -> bool:
+    """True if a urllib3 error was caused by a connect/read timeout"""
+    from urllib3.exceptions import MaxRetryError, NewConnectionError, TimeoutError
+    if isinstance(error, MaxRetryError) and error.reason is not None:
+        error = error.reason
+    # NewConnectionError subclasses ConnectTimeoutError for historical reasons
+    return isinstance(error, TimeoutError) and not isinstance(error, NewConnectionError)
 
 
+def _fetch_json(url: str, fields: Optional[Dict[str, str]] = None):
+    """GET a python.org API endpoint and decode the JSON body"""
+    import urllib3
+    pool = _get_pool()
+    response = pool.request(
+        'GET', url, fields=fields, headers=dict(pool.headers, Accept='application/json'),
+        timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=REQUEST_TIMEOUT),
+    )
+    _raise_for_status(response, url)
+    return json.loads(response.data)
+
+
+class _ButtonFound(Exception):
+    """Raised by _DownloadButtonParser to stop parsing early"""
+
+
+class _DownloadButtonParser(HTMLParser):
+    """Capture the href and label of the first <a class="button"> on a page.
+
+    Parsing stops (via _ButtonFound) as soon as that link is closed, so the
+    rest of the document is never tokenized.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.href: Optional[str] = None
+        self.text_parts = []
+        self._in_button = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a' or self.href is not None:
+            return
+        attr_map = dict(attrs)
+        if 'button' in (attr_map.get('class') or '').split():
+            self.href = attr_map.get('href') or ''
+            self._in_button = True
+
+    def handle_data(self, data):
+        if self._in_button:
+            self.text_parts.append(data)
+
+    def handle_endtag(self, tag):
+        if self._in_button and tag == 'a':
+            self._in_button = False
+            raise _ButtonFound()
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.text_parts).strip()
+
+
+# Platform details never change during a run - probe them once
+_OS_NAME = platform.system().lower()
+_MACHINE = platform.machine().lower()
+_PY_VER = platform.python_version()
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_string() -> str:
+    """platform.platform(), computed on first use (it scans the interpreter
+    binary for the libc version, so only `info` should pay for it)"""
+    return platform.platform()
+
+
+@functools.lru_cache(maxsize=1)
 def get_os_info():
     """Detect the operating system and architecture"""
-    os_name = platform.system().lower()
-    machine = platform.machine().lower()
+    os_name = _OS_NAME
+    machine = _MACHINE
     
     # Normalize architecture names
     if machine in ['amd64', 'x86_64']:
@@ -61,10 +204,22 @@ def get_os_info():
     return os_name, arch
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_pkg_mgr() -> Optional[str]:
+    """Return the first supported package manager found on PATH (probed once)"""
+    # Only look for this OS's tools - e.g. macOS ships an unrelated
+    # /usr/bin/apt (a Java stub) that must not shadow Homebrew
+    candidates = ('brew',) if _OS_NAME == 'darwin' else ('apt', 'dnf', 'yum')
+    for name in candidates:
+        if shutil.which(name):
+            return name
+    return None
+
+
 def is_admin():
     """Check if script is running with admin/sudo privileges"""
     try:
-        if platform.system().lower() == 'windows':
+        if _OS_NAME == 'windows':
             import ctypes
             # Type hint fix: windll is only available on Windows
             return ctypes.windll.shell32.IsUserAnAdmin() != 0  # type: ignore[attr-defined]
@@ -75,20 +230,87 @@ def is_admin():
         return False
 
 
+@functools.lru_cache(maxsize=64)
 def validate_version_string(version_str: str) -> bool:
     """Validate that version string matches expected format (e.g., 3.11.5)"""
     if not version_str:
         return False
     # Match format: digit.digit[.digit[...]]
-    pattern = r'^\d+\.\d+(\.\d+)*$'
-    return bool(re.match(pattern, version_str))
+    return _VER_RE.match(version_str) is not None
+
+
+def split_version(version_str: str) -> Tuple[str, ...]:
+    """Split a version string into its parts, e.g. "3.11.5" -> ("3", "11", "5")"""
+    parts = _VER_SPLIT_CACHE.get(version_str)
+    if parts is None:
+        parts = _VER_SPLIT_CACHE[version_str] = tuple(version_str.split('.'))
+    return parts
 
 
-def get_latest_python_info_with_retry() -> Tuple[Optional[str], Optional[str]]:
-    """Fetch the latest Python version with retry logic"""
+def _cache_file() -> Path:
+    """Location of the latest-version cache (XDG on Unix, LOCALAPPDATA on Windows)"""
+    if _OS_NAME == 'windows':
+        base = os.environ.get('LOCALAPPDATA') or str(Path.home() / 'AppData' / 'Local')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(base) / 'pyvm-updater' / 'latest.json'
+
+
+def _load_version_cache() -> Optional[dict]:
+    """Read the cached latest-version lookup, or None if missing/unusable"""
+    try:
+        with open(_cache_file(), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(entry, dict) or entry.get('src') not in (RELEASE_API_URL, DOWNLOADS_URL):
+        return None
+    if not isinstance(entry.get('ts'), (int, float)):
+        return None
+    ver = entry.get('ver')
+    if not isinstance(ver, str) or not validate_version_string(ver):
+        return None
+    # Optional fields are sent back as-is (URL, request headers)
+    for key in ('url', 'etag', 'last_modified'):
+        if not isinstance(entry.get(key), (str, type(None))):
+            return None
+    return entry
+
+
+def _save_version_cache(entry: dict):
+    """Atomically rewrite the version cache. Failures are not fatal."""
+    path = _cache_file()
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                         suffix='.tmp', delete=False) as f:
+            tmp_name = f.name
+            json.dump(entry, f)
+        os.replace(tmp_name, path)
+    except OSError:
+        if tmp_name:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+
+
+def get_latest_python_info_with_retry(use_cache: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """Fetch the latest Python version with retry logic
+    
+    A result fetched within the last CACHE_TTL seconds is reused from the
+    on-disk cache unless use_cache is False. A stale entry is still used to
+    revalidate the page with a conditional request.
+    """
+    cached = _load_version_cache() if use_cache else None
+    if cached and 0 <= time.time() - cached['ts'] < CACHE_TTL:
+        return cached['ver'], cached.get('url')
+    
     for attempt in range(MAX_RETRIES):
         try:
-            result = get_latest_python_info()
+            result = get_latest_python_info(cached)
             if result[0]:  # If we got a version
                 return result
             if attempt < MAX_RETRIES - 1:
@@ -102,98 +324,328 @@ def get_latest_python_info_with_retry() -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def get_latest_python_info() -> Tuple[Optional[str], Optional[str]]:
-    """Fetch the latest Python version and download URLs"""
-    URL = "https://www.python.org/downloads/"
+def _conditional_headers(base: dict, cached: Optional[dict], src: str) -> dict:
+    """Add If-None-Match/If-Modified-Since from a cache entry fetched from src"""
+    headers = dict(base)
+    if cached and cached.get('src') == src:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+
+def _cache_lookup(src: str, response, latest_ver: str, url: Optional[str]):
+    """Store a fresh lookup together with the response's cache validators"""
+    _save_version_cache({
+        'src': src,
+        'ts': time.time(),
+        'ver': latest_ver,
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    })
+
+
+def _latest_from_release_api(cached: Optional[dict]) -> Tuple[Optional[str], Optional[str]]:
+    """Pick the newest stable release from python.org's JSON downloads API"""
+    import urllib3
+    
+    pool = _get_pool()
+    headers = _conditional_headers(dict(pool.headers, Accept='application/json'), cached, RELEASE_API_URL)
+    response = pool.request(
+        'GET', RELEASE_API_URL, fields={'is_published': 'true', 'pre_release': 'false', 'version': '3'},
+        headers=headers, timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=REQUEST_TIMEOUT),
+    )
+    if cached and cached.get('src') == RELEASE_API_URL and response.status == 304:
+        _save_version_cache(dict(cached, ts=time.time()))
+        return cached['ver'], cached.get('url')
+    
+    # A bad status here just means "use the fallback", not a network failure
+    if response.status >= 400:
+        return None, None
+    releases = json.loads(response.data)
+    
+    # Filter again client-side in case the query parameters are ignored
+    best: Optional[Tuple[Tuple[int, ...], str, dict]] = None
+    for release in releases:
+        if not release.get('is_published') or release.get('pre_release'):
+            continue
+        # Only CPython 3 releases - the API also lists other products
+        if release.get('version') != 3:
+            continue
+        match = _RELEASE_NAME_RE.match(str(release.get('name', '')))
+        if not match:
+            continue
+        release_ver = match.group(1)
+        key = tuple(int(part) for part in split_version(release_ver))
+        if best is None or key > best[0]:
+            best = (key, release_ver, release)
     
+    if best is None:
+        return None, None
+    
+    _, latest_ver, release = best
+    release_url = release.get('release_page') or \
+        f"https://www.python.org/downloads/release/{release.get('slug')}/"
+    _cache_lookup(RELEASE_API_URL, response, latest_ver, release_url)
+    return latest_ver, release_url
+
+
+def _latest_from_downloads_page(cached: Optional[dict]) -> Tuple[Optional[str], Optional[str]]:
+    """Scrape the version from the first download button on python.org/downloads"""
+    import urllib3
+    
+    pool = _get_pool()
+    headers = _conditional_headers(pool.headers, cached, DOWNLOADS_URL)
+    response = pool.request(
+        'GET', DOWNLOADS_URL, headers=headers, preload_content=False,
+        timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=REQUEST_TIMEOUT),
+    )
     try:
-        response = requests.get(URL, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        # Specify parser explicitly for consistency
-        soup = BeautifulSoup(response.text, 'html.parser')
+        if cached and cached.get('src') == DOWNLOADS_URL and response.status == 304:
+            response.drain_conn()
+            _save_version_cache(dict(cached, ts=time.time()))
+            return cached['ver'], cached.get('url')
         
-        # Get version from download button
-        download_button = soup.find('a', class_='button')
-        if not download_button:
-            print("Error: Could not find download button on Python.org")
-            return None, None
+        _raise_for_status(response, DOWNLOADS_URL)
         
-        latest_ver_string = download_button.get_text(strip=True)
-        latest_ver = latest_ver_string.split()[-1]
-        
-        # Validate version string
-        if not validate_version_string(latest_ver):
-            print(f"Error: Invalid version format retrieved: {latest_ver}")
-            return None, None
-        
-        # Get download URL for specific OS
-        download_url_raw = download_button.get('href')
-        download_url: Optional[str] = None
-        if download_url_raw and isinstance(download_url_raw, str):
-            if not download_url_raw.startswith('http'):
-                download_url = f"https://www.python.org{download_url_raw}"
-            else:
-                download_url = download_url_raw
+        # Parse the page as it arrives and stop at the download button.
+        # python.org serves UTF-8, so decode explicitly rather than
+        # guessing the charset.
+        parser = _DownloadButtonParser()
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        try:
+            for chunk in response.stream(PAGE_CHUNK_SIZE):
+                parser.feed(decoder.decode(chunk))
+        except _ButtonFound:
+            # Drain the remainder unparsed so the connection can be reused
+            response.drain_conn()
+    finally:
+        # Fully read responses are already back in the pool; anything
+        # left half-read (e.g. an error body) must not be reused
+        response.close()
+    
+    if parser.href is None or not parser.text:
+        print("Error: Could not find download button on Python.org")
+        return None, None
+    
+    latest_ver = parser.text.split()[-1]
+    
+    # Validate version string
+    if not validate_version_string(latest_ver):
+        print(f"Error: Invalid version format retrieved: {latest_ver}")
+        return None, None
+    
+    # Get download URL for specific OS
+    download_url_raw = parser.href
+    download_url: Optional[str] = None
+    if download_url_raw:
+        if not download_url_raw.startswith('http'):
+            download_url = f"https://www.python.org{download_url_raw}"
+        else:
+            download_url = download_url_raw
+    
+    _cache_lookup(DOWNLOADS_URL, response, latest_ver, download_url)
+    return latest_ver, download_url
+
+
+@_require('urllib3')
+def get_latest_python_info(cached: Optional[dict] = None) -> Tuple[Optional[str], Optional[str]]:
+    """Fetch the latest Python version and a download/release URL
+    
+    Asks python.org's JSON downloads API first and falls back to scraping
+    the downloads page. If a previous cache entry is given, its
+    ETag/Last-Modified validators are sent and a 304 Not Modified answer
+    reuses it. Successful lookups are written back to the on-disk cache.
+    """
+    import urllib3
+    
+    try:
+        # Transport errors (urllib3 HTTPError) propagate: no point sending a
+        # second request if python.org is unreachable. Only an error status
+        # or an unexpected response body falls back to the downloads page.
+        try:
+            latest_ver, url = _latest_from_release_api(cached)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            latest_ver, url = None, None
+        if latest_ver:
+            return latest_ver, url
         
-        return latest_ver, download_url
+        return _latest_from_downloads_page(cached)
         
-    except requests.Timeout:
-        print("Error: Request to python.org timed out. Check your internet connection.")
-        return None, None
-    except requests.RequestException as e:
-        print(f"Error: Network request failed: {e}")
+    except urllib3.exceptions.HTTPError as e:
+        if _is_timeout(e):
+            print("Error: Request to python.org timed out. Check your internet connection.")
+        else:
+            print(f"Error: Network request failed: {e}")
         return None, None
     except Exception as e:
         print(f"Error: Unexpected error while fetching Python info: {e}")
         return None, None
 
 
-def download_file(url: str, destination: str) -> bool:
-    """Download a file with progress indication and integrity checking"""
+@_require('urllib3')
+def get_installer_checksum(version_str: str, filename: str) -> Optional[Tuple[str, str]]:
+    """
+    Look up the published checksum of a release file on python.org
+    Returns: (algorithm, hexdigest) - sha256 when published, else md5 - or None
+    """
+    import urllib3
+    
+    slug = f"python-{''.join(split_version(version_str))}"
+    try:
+        releases = _fetch_json(RELEASE_API_URL, {'slug': slug})
+        release = next((r for r in releases if r.get('slug') == slug), None)
+        if not release:
+            return None
+        release_id = release['resource_uri'].rstrip('/').rsplit('/', 1)[-1]
+        files = _fetch_json(RELEASE_FILE_API_URL, {'release': release_id})
+        
+        for release_file in files:
+            if not str(release_file.get('url', '')).endswith('/' + filename):
+                continue
+            for algorithm in ('sha256', 'md5'):
+                digest = release_file.get(f'{algorithm}_sum')
+                if digest:
+                    return algorithm, digest.strip().lower()
+        return None
+    except (urllib3.exceptions.HTTPError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _open_tmp(dir_: str) -> Tuple[int, Optional[str]]:
+    """
+    Open a new temporary file in dir_ for writing
+    Returns: (fd, path) - path is None for an unnamed O_TMPFILE file (Linux),
+    which disappears on its own unless it is linked into place
+    """
+    if hasattr(os, 'O_TMPFILE'):
+        try:
+            return os.open(dir_, os.O_TMPFILE | os.O_WRONLY, 0o600), None
+        except OSError:
+            pass  # Filesystem or kernel without O_TMPFILE support
+    fd, path = tempfile.mkstemp(dir=dir_, prefix='.pyvm-', suffix='.part')
+    return fd, path
+
+
+def _link_tmp(fd: int, destination: str):
+    """Give an unnamed O_TMPFILE file the name destination"""
+    dest_dir, name = os.path.split(os.path.abspath(destination))
+    # Passing a dir fd makes os.link() use linkat(AT_SYMLINK_FOLLOW), which is
+    # needed to link through the /proc/self/fd symlink
+    dir_fd = os.open(dest_dir, os.O_RDONLY)
+    try:
+        try:
+            os.remove(name, dir_fd=dir_fd)
+        except FileNotFoundError:
+            pass
+        os.link(f"/proc/self/fd/{fd}", name, dst_dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class _ByteCounter:
+    """Plain "Downloading: N bytes" counter for responses without a size"""
+
+    def __init__(self):
+        self.downloaded = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        print()  # New line after progress
+
+    def update(self, n: int):
+        self.downloaded += n
+        print(f"\rDownloading: {self.downloaded} bytes", end='', flush=True)
+
+
+@_require('urllib3')
+def download_file(url: str, destination: str, checksum: Optional[Tuple[str, str]] = None) -> bool:
+    """Download a file with progress indication and integrity checking
+    
+    checksum is an optional (algorithm, hexdigest) pair; the file is hashed
+    while it is written and discarded if the digest does not match.
+    """
+    import urllib3
+    response = None
     try:
         # Validate URL
         if not url.startswith(('https://', 'http://')):
             print(f"Error: Invalid URL scheme: {url}")
             return False
             
-        response = requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
+        response = _get_pool().request(
+            'GET', url, preload_content=False,
+            timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=DOWNLOAD_TIMEOUT),
+        )
+        _raise_for_status(response, url)
         
         total_size = int(response.headers.get('content-length', 0))
-        block_size = 8192
-        downloaded = 0
-        
-        with open(destination, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=block_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\rDownloading: {percent:.1f}% ({downloaded}/{total_size} bytes)", end='', flush=True)
-                    else:
-                        # No content-length header
-                        print(f"\rDownloading: {downloaded} bytes", end='', flush=True)
-        
-        print()  # New line after progress
         
-        # Verify file was downloaded
-        if not os.path.exists(destination):
-            print("Error: Downloaded file not found")
-            return False
+        # Write through the raw fd - large chunks don't benefit from Python's
+        # buffered writer. The file only appears at destination once it is
+        # complete and verified; a failed or interrupted download leaves
+        # nothing behind.
+        # Writes are plain synchronous os.write() calls on purpose: they only
+        # copy into the OS page cache, and write-back to disk already overlaps
+        # with the next network read, so an async submission queue buys nothing.
+        fd, tmp_path = _open_tmp(os.path.dirname(os.path.abspath(destination)))
+        hasher = hashlib.new(checksum[0]) if checksum else None
+        try:
+            # click throttles redraws itself, so updating per chunk is cheap.
+            # Without a Content-Length there is nothing to draw a bar against.
+            if total_size:
+                progress = click.progressbar(length=total_size, label='Downloading')
+            else:
+                progress = _ByteCounter()
+            with progress as bar:
+                for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        # Hash from memory in the same pass instead of
+                        # re-reading the file afterwards
+                        if hasher:
+                            hasher.update(chunk)
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view):]
+                        bar.update(len(chunk))
             
-        file_size = os.path.getsize(destination)
-        if total_size and file_size != total_size:
-            print(f"Warning: Downloaded file size ({file_size}) doesn't match expected size ({total_size})")
+            file_size = os.fstat(fd).st_size
+            if total_size and file_size != total_size:
+                print(f"Warning: Downloaded file size ({file_size}) doesn't match expected size ({total_size})")
             
+            if hasher and checksum:
+                if hasher.hexdigest() != checksum[1]:
+                    print(f"Error: {checksum[0].upper()} checksum mismatch - the download may be corrupted or tampered with")
+                    return False
+                print(f"✓ {checksum[0].upper()} checksum verified")
+            
+            if tmp_path is None:
+                _link_tmp(fd, destination)
+            os.close(fd)
+            fd = -1
+            if tmp_path is not None:
+                os.replace(tmp_path, destination)
+                tmp_path = None
+        finally:
+            if fd >= 0:
+                os.close(fd)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        
         return True
         
-    except requests.Timeout:
-        print("\nError: Download timed out. Please check your internet connection.")
-        return False
-    except requests.RequestException as e:
-        print(f"\nError: Download failed: {e}")
+    except urllib3.exceptions.HTTPError as e:
+        if _is_timeout(e):
+            print("\nError: Download timed out. Please check your internet connection.")
+        else:
+            print(f"\nError: Download failed: {e}")
         return False
     except IOError as e:
         print(f"\nError: Could not write to file {destination}: {e}")
@@ -201,10 +653,19 @@ def download_file(url: str, destination: str) -> bool:
     except Exception as e:
         print(f"\nError: Unexpected error during download: {e}")
         return False
+    finally:
+        # A fully read body has already returned its connection to the pool
+        if response is not None:
+            response.close()
 
 
-def update_python_windows(version_str: str) -> bool:
-    """Update Python on Windows"""
+def update_python_windows(version_str: str, arch: str, auto: bool = False) -> bool:
+    """Update Python on Windows
+    
+    arch is the normalized architecture from get_os_info() (amd64, arm64, x86).
+    With auto the installer runs unattended; otherwise its wizard is started
+    detached and this returns without waiting for it.
+    """
     print("\n🪟 Windows detected - Downloading Python installer...")
     
     # Validate version string
@@ -214,7 +675,7 @@ def update_python_windows(version_str: str) -> bool:
     
     # Construct Windows installer URL - safely
     try:
-        parts = version_str.split('.')
+        parts = split_version(version_str)
         if len(parts) < 3:
             print(f"Error: Version string must have major.minor.patch format: {version_str}")
             return False
@@ -223,11 +684,8 @@ def update_python_windows(version_str: str) -> bool:
         print(f"Error parsing version string '{version_str}': {e}")
         return False
     
-    # Detect architecture - handle ARM64, AMD64, and default to win32
-    machine = platform.machine().lower()
-    if machine in ['amd64', 'x86_64']:
-        arch = 'amd64'
-    elif machine in ['arm64', 'aarch64']:
+    # Pick the installer for the detected architecture (see get_os_info)
+    if arch == 'arm64':
         # ARM64 Windows installers are only available for Python 3.11+
         # Fall back to AMD64 for older versions
         try:
@@ -237,34 +695,50 @@ def update_python_windows(version_str: str) -> bool:
                 print("ARM64 installers are only available for Python 3.11+")
                 print(f"Falling back to AMD64 installer for Python {version_str}")
                 arch = 'amd64'
-            else:
-                arch = 'arm64'
         except (ValueError, TypeError):
             # default to AMD64 for safety
             print("Could not parse version, falling back to AMD64")
             arch = 'amd64'
-    else:
+    elif arch != 'amd64':
         arch = 'win32'
     installer_url = f"https://www.python.org/ftp/python/{version_str}/python-{version_str}-{arch}.exe"
     
     temp_dir = tempfile.gettempdir()
     installer_path = os.path.join(temp_dir, f"python-{version_str}-installer.exe")
     
+    checksum = get_installer_checksum(version_str, installer_url.rsplit('/', 1)[-1])
+    if not checksum:
+        print("Warning: Could not fetch the installer checksum from python.org; skipping verification")
+    
     print(f"Downloading from: {installer_url}")
-    if not download_file(installer_url, installer_path):
+    if not download_file(installer_url, installer_path, checksum):
         return False
     
-    print("\n⚠️  Starting installer...")
-    print("Please follow the installer prompts.")
-    print("Recommendation: Check 'Add Python to PATH'")
-    
+    detached = False
     try:
-        # Run installer (interactive mode) - using list instead of shell
-        result = subprocess.run([installer_path], check=False)
+        if auto:
+            # Documented unattended-install options of the python.org installer
+            print("\n⚙️  Running installer silently...")
+            result = subprocess.run(
+                [installer_path, "/quiet", "InstallAllUsers=0", "PrependPath=1", "Include_test=0"],
+                check=False,
+            )
+            if result.returncode != 0:
+                print(f"Error: Installer exited with code {result.returncode}")
+                return False
+            return True
         
-        if result.returncode != 0:
-            print(f"Warning: Installer exited with code {result.returncode}")
+        print("\n⚠️  Starting installer...")
+        print("Please follow the installer prompts.")
+        print("Recommendation: Check 'Add Python to PATH'")
         
+        # The GUI wizard doesn't need this process - detach it instead of
+        # blocking the CLI until the user clicks through it
+        flags = getattr(subprocess, 'DETACHED_PROCESS', 0) | getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)
+        subprocess.Popen([installer_path], creationflags=flags, close_fds=True)
+        detached = True
+        print("\nThe installer is running in its own window; finish the wizard there.")
+        print(f"You can delete {installer_path} once it is done.")
         return True
         
     except FileNotFoundError:
@@ -277,9 +751,10 @@ def update_python_windows(version_str: str) -> bool:
         print(f"Error running installer: {e}")
         return False
     finally:
-        # Cleanup - with better error handling
+        # Cleanup - with better error handling. A detached installer is
+        # still running from this file, so it has to stay.
         try:
-            if os.path.exists(installer_path):
+            if not detached and os.path.exists(installer_path):
                 os.remove(installer_path)
                 print(f"Cleaned up temporary installer file")
         except PermissionError:
@@ -299,7 +774,7 @@ def update_python_linux(version_str: str) -> bool:
     
     # Extract major.minor version (e.g., "3.11" from "3.11.5")
     try:
-        parts = version_str.split('.')
+        parts = split_version(version_str)
         if len(parts) < 2:
             print(f"Error: Invalid version format: {version_str}")
             return False
@@ -309,21 +784,43 @@ def update_python_linux(version_str: str) -> bool:
         return False
     
     # Detect package manager
-    if shutil.which('apt'):
+    pkg_mgr = _detect_pkg_mgr()
+    if pkg_mgr == 'apt':
         print("Using apt package manager...")
         print("\n⚠️  This requires sudo privileges to install Python.")
         print("⚠️  This will add the deadsnakes PPA (third-party repository).")
         print("\n⚠️  IMPORTANT: This will NOT modify your system's default Python.")
         print("    Your existing Python will remain unchanged.")
         
+        # Ask for the sudo password once up front; later sudo calls reuse
+        # the cached credential instead of re-authenticating each time
+        try:
+            result = subprocess.run(["sudo", "-v"], check=False)
+        except FileNotFoundError:
+            print("Error: Command not found: sudo")
+            return False
+        if result.returncode != 0:
+            print("Error: Could not obtain sudo privileges.")
+            return False
+        
+        # Install all packages in a single apt transaction. distutils was
+        # removed in Python 3.12, so deadsnakes has no -distutils package
+        # for newer versions and asking for it would fail the whole install.
+        packages = [f"python{major_minor}", f"python{major_minor}-venv"]
+        if (int(parts[0]), int(parts[1])) < (3, 12):
+            packages.append(f"python{major_minor}-distutils")
+        
         # Use safer subprocess approach - no shell=True
-        commands = [
-            ["sudo", "apt", "update"],
-            ["sudo", "apt", "install", "-y", "software-properties-common"],
+        commands = []
+        if not shutil.which('add-apt-repository'):
+            commands += [
+                ["sudo", "apt", "update"],
+                ["sudo", "apt", "install", "-y", "software-properties-common"],
+            ]
+        commands += [
             ["sudo", "add-apt-repository", "-y", "ppa:deadsnakes/ppa"],
             ["sudo", "apt", "update"],
-            ["sudo", "apt", "install", "-y", f"python{major_minor}"],
-            ["sudo", "apt", "install", "-y", f"python{major_minor}-venv", f"python{major_minor}-distutils"]
+            ["sudo", "apt", "install", "-y", *packages],
         ]
         
         for cmd in commands:
@@ -350,8 +847,7 @@ def update_python_linux(version_str: str) -> bool:
         print(f"\n💡 Your system Python remains unchanged. Use 'python{major_minor}' to access the new version.")
         return True
     
-    elif shutil.which('yum') or shutil.which('dnf'):
-        pkg_mgr = 'dnf' if shutil.which('dnf') else 'yum'
+    elif pkg_mgr in ('dnf', 'yum'):
         print(f"Using {pkg_mgr} package manager...")
         print("\n⚠️  This requires sudo privileges.")
         print(f"\nPlease run manually:")
@@ -369,8 +865,21 @@ def update_python_linux(version_str: str) -> bool:
         print(f"  pyenv install {version_str}")
         return False
 
-def update_python_macos(version_str: str) -> bool:
-    """Update Python on macOS using Homebrew or official installer"""
+def start_brew_update() -> Optional[subprocess.Popen]:
+    """Start `brew update` in the background, or return None if it can't run"""
+    try:
+        return subprocess.Popen(["brew", "update"], stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True)
+    except OSError:
+        return None
+
+
+def update_python_macos(version_str: str, brew_update: Optional[subprocess.Popen] = None) -> bool:
+    """Update Python on macOS using Homebrew or official installer
+    
+    brew_update may be a `brew update` process already started with
+    start_brew_update(); it is waited for instead of running a new one.
+    """
     print("\n🍎 macOS detected")
     
     # Validate version string
@@ -380,7 +889,7 @@ def update_python_macos(version_str: str) -> bool:
     
     # Extract major.minor version for reuse in both branches
     try:
-        parts = version_str.split('.')
+        parts = split_version(version_str)
         if len(parts) < 2:
             print(f"Error: Invalid version format: {version_str}")
             return False
@@ -389,15 +898,23 @@ def update_python_macos(version_str: str) -> bool:
         print(f"Error parsing version: {e}")
         return False
     
-    if shutil.which('brew'):
+    if _detect_pkg_mgr() == 'brew':
         print("Using Homebrew...")
         
         try:
             # Update Homebrew
             print("Updating Homebrew...")
-            result = subprocess.run(["brew", "update"], check=False, capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"Warning: brew update failed: {result.stderr}")
+            if brew_update is None:
+                brew_update = start_brew_update()
+            if brew_update is not None:
+                _, stderr = brew_update.communicate()
+                returncode = brew_update.returncode
+            else:
+                # Couldn't start it in the background - run it directly
+                result = subprocess.run(["brew", "update"], check=False, capture_output=True, text=True)
+                stderr, returncode = result.stderr, result.returncode
+            if returncode != 0:
+                print(f"Warning: brew update failed: {stderr}")
             
             # Try to install specific version using python@major.minor format
             formula_name = f"python@{major_minor}"
@@ -439,18 +956,19 @@ def update_python_macos(version_str: str) -> bool:
         return False
 
 
-def check_python_version(silent: bool = False) -> Tuple[str, Optional[str], bool]:
+def check_python_version(silent: bool = False, use_cache: bool = True) -> Tuple[str, Optional[str], bool]:
     """
     Check local Python version against the latest stable version from python.org
+    Set use_cache=False to bypass the cached lookup and always query python.org.
     Returns: (local_version, latest_version, needs_update)
     """
-    local_ver = platform.python_version()
+    local_ver = _PY_VER
     
     if not silent:
         print(f"Checking Python version... (Current: {local_ver})")
 
     # Use retry logic
-    latest_ver, _ = get_latest_python_info_with_retry()
+    latest_ver, _ = get_latest_python_info_with_retry(use_cache=use_cache)
     
     if not latest_ver:
         if not silent:
@@ -465,10 +983,15 @@ def check_python_version(silent: bool = False) -> Tuple[str, Optional[str], bool
                 print(f"Error: Invalid version format from server: {latest_ver}")
             return local_ver, None, False
         
-        # Use 'version.parse' to create comparable version objects
-        local_version_obj = pkg_version.parse(local_ver)
-        latest_version_obj = pkg_version.parse(latest_ver)
-        needs_update = local_version_obj < latest_version_obj
+        # Both sides are plain X.Y.Z here, so integer tuples compare correctly.
+        # The local version comes from sys.version_info because
+        # python_version() may carry a pre-release suffix (e.g. 3.13.0rc2).
+        local_t = tuple(sys.version_info[:3])
+        latest_t = tuple(int(part) for part in split_version(latest_ver))
+        latest_t += (0,) * (3 - len(latest_t))  # "3.14" means 3.14.0
+        needs_update = local_t < latest_t or (
+            local_t == latest_t and sys.version_info.releaselevel != 'final'
+        )
 
         if not silent:
             # Display Results
@@ -493,23 +1016,30 @@ def check_python_version(silent: bool = False) -> Tuple[str, Optional[str], bool
         return local_ver, latest_ver, False
 
 
-def show_python_usage_instructions(version_str: str, os_name: str):
+def show_python_usage_instructions(version_str: str, os_name: str, pending: bool = False):
     """
     Show user how to use the newly installed Python version.
     Does NOT modify system defaults - just provides instructions.
+    Set pending when the installer is still running (detached Windows wizard).
     """
     # Extract major.minor for display
     try:
-        parts = version_str.split('.')
+        parts = split_version(version_str)
         major_minor = f"{parts[0]}.{parts[1]}"
     except (ValueError, IndexError):
         major_minor = version_str
     
     click.echo("\n" + "=" * 60)
-    click.echo("✅ Installation Complete!")
-    click.echo("=" * 60)
-    click.echo(f"\n📌 Python {version_str} has been installed successfully!")
-    click.echo("\n📚 How to use your new Python version:")
+    if pending:
+        click.echo("⏳ Installer Started")
+        click.echo("=" * 60)
+        click.echo(f"\n📌 Finish the Python {version_str} installer wizard to complete the installation.")
+        click.echo("\n📚 Once it is done, use your new Python version like this:")
+    else:
+        click.echo("✅ Installation Complete!")
+        click.echo("=" * 60)
+        click.echo(f"\n📌 Python {version_str} has been installed successfully!")
+        click.echo("\n📚 How to use your new Python version:")
     click.echo("-" * 60)
     
     if os_name == 'linux' or os_name == 'darwin':
@@ -563,10 +1093,11 @@ def cli(ctx, version):
 
 
 @cli.command()
-def check():
+@click.option('--no-cache', is_flag=True, help='Always query python.org instead of using the cached result')
+def check(no_cache):
     """Check current Python version against latest stable release"""
     try:
-        local_ver, latest_ver, needs_update = check_python_version(silent=False)
+        local_ver, latest_ver, needs_update = check_python_version(silent=False, use_cache=not no_cache)
         
         if needs_update:
             click.echo("\n💡 Tip: Run 'pyvm update' to upgrade Python")
@@ -582,18 +1113,20 @@ def check():
 @cli.command()
 @click.option('--auto', is_flag=True, help='Automatically proceed without confirmation')
 @click.option('--version', 'target_version', default=None, help='Specify a target Python version (e.g., 3.11.5)')
-def update(auto, target_version):
+@click.option('--no-cache', is_flag=True, help='Always query python.org instead of using the cached result')
+def update(auto, target_version, no_cache):
     """Download and install Python version (does NOT modify system defaults)
     
     By default, installs the latest version. Use --version to specify a particular version.
     """
+    brew_update = None
     try:
-        local_ver = platform.python_version()
+        local_ver = _PY_VER
         install_version = None
         
         if target_version:
             # Validate specified version
-            if not validate_version_string(target_version) or len(target_version.split('.')) < 3:
+            if not validate_version_string(target_version) or len(split_version(target_version)) < 3:
                 click.echo(f"❌ Error: Invalid version format: {target_version}")
                 click.echo("Version must be in format: X.Y.Z (e.g., 3.11.5)")
                 sys.exit(1)
@@ -604,7 +1137,7 @@ def update(auto, target_version):
         else:
             # Check for latest version
             click.echo("🔍 Checking for updates...")
-            local_ver, latest_ver, needs_update = check_python_version(silent=True)
+            local_ver, latest_ver, needs_update = check_python_version(silent=True, use_cache=not no_cache)
             
             if not latest_ver:
                 click.echo("❌ Could not fetch latest version information.")
@@ -620,6 +1153,12 @@ def update(auto, target_version):
             click.echo(f"\n🚀 Update available: {local_ver} → {latest_ver}")
             install_version = latest_ver
         
+        os_name, arch = get_os_info()
+        
+        # Let Homebrew refresh itself while the user reads the prompt
+        if os_name == 'darwin' and _detect_pkg_mgr() == 'brew':
+            brew_update = start_brew_update()
+        
         # Confirm update
         if not auto:
             if not click.confirm(f"\nDo you want to proceed with installing Python {install_version}?"):
@@ -627,24 +1166,26 @@ def update(auto, target_version):
                 sys.exit(0)
         
         # Check admin privileges for some operations
-        os_name, arch = get_os_info()
         click.echo(f"\n🖥️  Detected: {os_name.title()} ({arch})")
         
         # Perform update based on OS
         success = False
         if os_name == 'windows':
-            success = update_python_windows(install_version)
+            success = update_python_windows(install_version, arch, auto)
         elif os_name == 'linux':
             success = update_python_linux(install_version)
         elif os_name == 'darwin':
-            success = update_python_macos(install_version)
+            success = update_python_macos(install_version, brew_update)
         else:
             click.echo(f"❌ Unsupported operating system: {os_name}")
             sys.exit(1)
         
         if success:
-            # Show usage instructions (safe, no system modifications)
-            show_python_usage_instructions(install_version, os_name)
+            # Show usage instructions (safe, no system modifications).
+            # Without --auto the Windows wizard is still open, so the
+            # install isn't finished yet.
+            pending = os_name == 'windows' and not auto
+            show_python_usage_instructions(install_version, os_name, pending=pending)
         else:
             click.echo("\n⚠️  Installation process encountered issues.")
             click.echo("    Please check the messages above.")
@@ -656,6 +1197,10 @@ def update(auto, target_version):
     except Exception as e:
         click.echo(f"\n❌ Error: {e}")
         sys.exit(1)
+    finally:
+        # Don't leave a background brew update running if we bailed out early
+        if brew_update and brew_update.poll() is None:
+            brew_update.terminate()
 
 
 
@@ -672,26 +1217,16 @@ def info():
         os_name, arch = get_os_info()
         click.echo(f"Operating System: {os_name.title()}")
         click.echo(f"Architecture:     {arch}")
-        click.echo(f"Python Version:   {platform.python_version()}")
+        click.echo(f"Python Version:   {_PY_VER}")
         click.echo(f"Python Path:      {sys.executable}")
-        click.echo(f"Platform:         {platform.platform()}")
+        click.echo(f"Platform:         {_platform_string()}")
         
         click.echo(f"\nAdmin/Sudo:       {'Yes' if is_admin() else 'No'}")
         
         # Show python3 command location if different
-        try:
-            result = subprocess.run(
-                ["which", "python3"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                python3_path = result.stdout.strip()
-                if python3_path != sys.executable:
-                    click.echo(f"python3 command:  {python3_path}")
-        except Exception:
-            pass
+        python3_path = shutil.which("python3")
+        if python3_path and python3_path != sys.executable:
+            click.echo(f"python3 command:  {python3_path}")
         
         click.echo("=" * 50)
         
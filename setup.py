@@ -35,9 +35,7 @@ setup(
     ],
     python_requires=">=3.9",
     install_requires=[
-        "requests>=2.25.0",
-        "beautifulsoup4>=4.9.0",
-        "packaging>=20.0",
+        "urllib3>=1.26.0",
         "click>=8.0.0",
     ],
     extras_require={